@@ -1,11 +1,12 @@
 from layout.code import print_code
 from layout.geocell import GeoApp
-from layout.page_configuration import page_config, set_page_width
+from layout.page_configuration import page_config, page_style, set_page_width
 from layout.styles import multi_color_styling, styling
 
 __all__ = [
     GeoApp,
     page_config,
+    page_style,
     set_page_width,
     print_code,
     styling,
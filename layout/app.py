@@ -4,13 +4,21 @@ import pandas as pd
 import streamlit as st
 import streamlit_antd_components as sac
 
-from layout import GeoApp, page_config, print_code, set_page_width, styling
+from layout import GeoApp, page_config, page_style, print_code, styling
 
 script_dir = os.path.dirname(__file__)
 sitelist_mcom = os.path.join(script_dir, "test_geocell.csv")
 sitelist_driveless = os.path.join(script_dir, "test_driveless.csv")
-mcom = pd.read_csv(sitelist_mcom)
-dt = pd.read_csv(sitelist_driveless)
+
+
+@st.cache_data
+def load_csv(path: str) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+@st.cache_resource
+def build_geoapp(geocell_path: str, driveless_path: str) -> GeoApp:
+    return GeoApp(load_csv(geocell_path), load_csv(driveless_path))
 
 
 def init_session_state():
@@ -30,17 +38,17 @@ def run_app():
         color="cyan",
         use_container_width=True,
     )
+    page_style(width=1300 if tab_idx == 0 else None)
 
     if tab_idx == 0:
-        set_page_width(1300)
-        app = GeoApp(sitelist_mcom, sitelist_driveless)
+        app = build_geoapp(sitelist_mcom, sitelist_driveless)
         app.run_geo_app()
     elif tab_idx == 1:
         st.markdown(*styling("Cells Data", tag="h6", font_size=18, text_align="left"))
-        st.write(mcom)
+        st.write(load_csv(sitelist_mcom))
         st.markdown(
             *styling("Geographic Data", tag="h6", font_size=18, text_align="left")
         )
-        st.write(dt)
+        st.write(load_csv(sitelist_driveless))
         st.markdown(*styling("Full Code", tag="h6", font_size=18, text_align="left"))
         print_code()
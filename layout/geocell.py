@@ -1,16 +1,284 @@
-import colorsys
-from collections.abc import Generator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
-from math import asin, atan2, cos, degrees, radians, sin
+from types import MappingProxyType
 
 import folium
+import numpy as np
 import pandas as pd
 import streamlit as st
 from branca.element import MacroElement, Template
+from folium.plugins import FastMarkerCluster
 from geopy.distance import geodesic
 
 from layout.styles import styling
 
+TILE_OPTIONS = MappingProxyType(
+    {
+        "Openstreetmap": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+        "Google Hybrid": "https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
+    }
+)
+
+# Only these columns are used by the map layers; anything else in the inputs
+# is dropped on load.
+GEOCELL_COLUMNS = [
+    "site",
+    "nodeid",
+    "cellname",
+    "Latitude",
+    "Longitude",
+    "Dir",
+    "Ant_BW",
+    "Ant_Size",
+]
+DRIVELESS_COLUMNS = ["cellname", "lat_grid", "long_grid", "rsrp"]
+# Repeated labels are stored as categories and integer columns are downcast
+# on load. Float columns keep float64: float32 coordinates would shift the
+# six-decimal output and serialize with spurious digits.
+CATEGORY_COLUMNS = ("site", "nodeid", "cellname")
+
+# Lower bound of each RSRP bucket (dBm) and its color; the first color covers
+# everything below the lowest limit.
+RSRP_LIMITS = np.array([-115, -110, -100, -95, -80])
+RSRP_COLORS = np.array(["red", "red", "yellow", "#93FC7C", "#14380A", "blue"])
+
+# Legend buckets for the RSRP statistics, from the lowest bin upwards. Each bin
+# is closed on the left: [-110, -100) counts as "-110 >= -100".
+RSRP_LEGEND_BINS = [-np.inf, -110, -100, -95, -80, np.inf]
+RSRP_LEGEND_LABELS = [
+    "-110 >= -140",
+    "-110 >= -100",
+    "-100 >= -95",
+    "-95  >= -80",
+    "-80  >= 0",
+]
+RSRP_LEGEND_COLORS = ["red", "yellow", "#93FC7C", "#14380A", "blue"]
+
+# Coordinates are emitted with six decimals (~0.1 m); more digits only bloat
+# the generated HTML.
+COORDINATE_DECIMALS = 6
+COORDINATE_COLUMNS = ("Latitude", "Longitude", "lat_grid", "long_grid")
+
+# Sectors with a radius below this (km) use a flat-earth offset instead of the
+# full great-circle formula. Up to 60 degrees latitude the offset stays within
+# 1e-6 degrees of the exact point, under one step of the emitted six decimals.
+SMALL_ANGLE_MAX_RADIUS_KM = 0.5
+
+# Driveless datasets at least this large are drawn as a client-side marker
+# cluster instead of one folium object per point.
+DRIVELESS_CLUSTER_THRESHOLD = 10_000
+# Below this zoom level individual driveless points overlap and are hidden,
+# unless the whole drive test only fits at a lower zoom. The cluster path is
+# not gated: its clusters already merge overlapping points when zoomed out.
+DRIVELESS_MIN_ZOOM = 12
+# Both driveless colorings are in every map; turning one on in LayerControl
+# turns the other off, and only the visible one's legend section is shown.
+DRIVELESS_LAYER_NAMES = MappingProxyType(
+    {False: "Driveless by RSRP", True: "Driveless by EUtranCell"}
+)
+LEGEND_SECTION_IDS = MappingProxyType({False: "legend-rsrp", True: "legend-cellname"})
+DRIVELESS_CLUSTER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 6, color: row[2], fillColor: row[2], fillOpacity: 1
+    });
+    marker.bindPopup(row[3]);
+    return marker;
+}
+"""
+
+CELL_LABEL_CSS = """
+<style>
+.cell-label {
+    font-size: 16pt;
+    color: black;
+    text-shadow: -1px -1px 0 white, 1px -1px 0 white, -1px 1px 0 white, 1px 1px 0 white;
+}
+</style>
+"""
+
+LEGEND_HEADER = """
+        <div id='maplegend' class='maplegend'
+            style='position: absolute; z-index:9999; background-color: rgba(192, 192, 192, 1);
+            border-radius: 6px; padding: 10px; font-size: 12px; right: 12px; top: 70px;'>
+        <div class='legend-scale'>
+        """
+LEGEND_FOOTER = """
+        </div>
+        </div>
+        <style type='text/css'>
+        .maplegend .legend-scale ul {margin: 0; padding: 0; color: #0f0f0f;}
+        .maplegend .legend-scale ul li {list-style: none; line-height: 18px; margin-bottom: 1.5px;}
+        .maplegend ul.legend-labels li span {
+            float: left;
+            height: 14px;
+            width: 14px;
+            margin-right: 4.5px;
+            border-radius: 50%;
+        }
+        </style>
+        """
+
+
+class ZoomGate(MacroElement):
+    """Detach a layer from its group while the map is zoomed out past min_zoom.
+
+    The threshold never exceeds the zoom that fits the layer's own bounds, so the
+    points are always shown in the view that frames them.
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent.get_name() }};
+            var group = {{ this.group.get_name() }};
+            var layer = {{ this.layer.get_name() }};
+            var bounds = layer.getBounds();
+            var minZoom = bounds.isValid()
+                ? Math.min({{ this.min_zoom }}, map.getBoundsZoom(bounds))
+                : {{ this.min_zoom }};
+            function update() {
+                var visible = map.getZoom() >= minZoom;
+                if (visible && !group.hasLayer(layer)) {
+                    group.addLayer(layer);
+                } else if (!visible && group.hasLayer(layer)) {
+                    group.removeLayer(layer);
+                }
+            }
+            map.on("zoomend", update);
+            update();
+        })();
+        {% endmacro %}
+        """
+    )
+
+    def __init__(
+        self, layer: folium.map.Layer, group: folium.FeatureGroup, min_zoom: int
+    ):
+        super().__init__()
+        self._name = "ZoomGate"
+        self.layer = layer
+        self.group = group
+        self.min_zoom = min_zoom
+
+
+def sector_beam_points(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    azimuth: np.ndarray,
+    beamwidth: np.ndarray,
+    radius: np.ndarray,
+    *,
+    num_points: int = 50,
+) -> np.ndarray:
+    """Return the sector arc points for every site as an (N, num_points + 1, 2) array.
+
+    Each site gets num_points arc points spread across its beamwidth followed by
+    the point on its azimuth (the sector edge), as (lat, lon) in degrees. Radius
+    is in kilometers.
+    """
+    lat_rad, lon_rad = np.radians(lat)[:, None], np.radians(lon)[:, None]
+    azimuth_rad = np.radians(azimuth)[:, None]
+    beamwidth_rad = np.radians(beamwidth)[:, None]
+    start_angle = azimuth_rad - beamwidth_rad / 2
+    step = beamwidth_rad / (num_points - 1)
+    angles = np.hstack([start_angle + np.arange(num_points) * step, azimuth_rad])
+
+    angular_distance = radius[:, None] / 6371
+    if np.all(radius < SMALL_ANGLE_MAX_RADIUS_KM):
+        # Flat-earth offset; see SMALL_ANGLE_MAX_RADIUS_KM for its error bound.
+        lat_new = lat_rad + angular_distance * np.cos(angles)
+        lon_new = lon_rad + angular_distance * np.sin(angles) / np.cos(lat_rad)
+        return np.degrees(np.stack([lat_new, lon_new], axis=-1))
+
+    sin_d, cos_d = np.sin(angular_distance), np.cos(angular_distance)
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    # Per-site factors, so the (N, num_points + 1) grid only sees the angle terms.
+    sin_lat_cos_d, cos_lat_sin_d = sin_lat * cos_d, cos_lat * sin_d
+    sin_lat_new = sin_lat_cos_d + cos_lat_sin_d * np.cos(angles)
+    lat_new = np.arcsin(sin_lat_new)
+    lon_new = lon_rad + np.arctan2(
+        np.sin(angles) * cos_lat_sin_d, cos_d - sin_lat * sin_lat_new
+    )
+    return np.degrees(np.stack([lat_new, lon_new], axis=-1))
+
+
+def hue_colors(hues: np.ndarray) -> list[str]:
+    """Return hex colors for hues in [0, 1) at full saturation and value.
+
+    Matches colorsys.hsv_to_rgb(hue, 1, 1) scaled to 0-255 and truncated.
+    """
+    hue6 = hues * 6.0
+    sector = hue6.astype(np.int32)
+    f = hue6 - sector
+    p, q, t, v = np.zeros(len(hues)), 1.0 - f, f, np.ones(len(hues))
+    sector %= 6
+    rgb = np.stack(
+        [
+            np.choose(sector, [v, q, p, p, t, v]),
+            np.choose(sector, [t, v, v, q, p, p]),
+            np.choose(sector, [p, p, t, v, v, q]),
+        ],
+        axis=1,
+    )
+    rgb_u8 = (rgb * 255).astype(np.uint32)
+    packed = rgb_u8[:, 0] << 16 | rgb_u8[:, 1] << 8 | rgb_u8[:, 2]
+    return [f"#{value:06x}" for value in packed.tolist()]
+
+
+# Cell colors come from a fixed palette of evenly spaced hues, visited with a
+# stride so that neighbouring cellnames (usually sectors of one site) get hues
+# far apart. Built once at import; data with more cells than entries falls back
+# to spreading its own hues evenly so that no two cells share a color.
+CI_PALETTE_SIZE = 256
+CI_PALETTE_STRIDE = 97
+_palette_steps = np.arange(CI_PALETTE_SIZE) * CI_PALETTE_STRIDE % CI_PALETTE_SIZE
+CI_PALETTE = tuple(hue_colors(_palette_steps / CI_PALETTE_SIZE))
+
+
+class ExclusiveLayers(MacroElement):
+    """Keep at most one of the layers on the map and show only its legend section."""
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent.get_name() }};
+            var entries = [
+                {%- for section_id, layer in this.layers.items() %}
+                [{{ layer.get_name() }}, document.getElementById({{ section_id|tojson }})],
+                {%- endfor %}
+            ];
+            function update() {
+                entries.forEach(function (entry) {
+                    entry[1].style.display = map.hasLayer(entry[0]) ? "" : "none";
+                });
+            }
+            map.on("overlayadd", function (event) {
+                // LayerControl ignores layer changes while it handles a click,
+                // so the other checkbox only clears if the removal waits.
+                setTimeout(function () {
+                    entries.forEach(function (entry) {
+                        if (entry[0] !== event.layer && map.hasLayer(entry[0])) {
+                            map.removeLayer(entry[0]);
+                        }
+                    });
+                    update();
+                }, 0);
+            });
+            map.on("overlayremove", update);
+            update();
+        })();
+        {% endmacro %}
+        """
+    )
+
+    def __init__(self, layers: Mapping[str, folium.map.Layer]):
+        super().__init__()
+        self._name = "ExclusiveLayers"
+        self.layers = layers
+
 
 @dataclass
 class GeoApp:
@@ -18,26 +286,55 @@ class GeoApp:
     driveless_data: str | pd.DataFrame
     unique_cellname: list[str] = field(init=False)
     map_center: list[float] = field(init=False)
-    tile_options: dict[str, str] = field(init=False)
-    map: folium.Map = field(init=False, default=None)
+    tile_options: Mapping[str, str] = field(init=False)
     ci_colors: dict[str, str] = field(init=False)
     cell_edge_coordinates: dict[str, list[float]] = field(default_factory=dict)
+    data_key: int = field(init=False)
+    sector_geojson: dict = field(init=False)
+    site_geojson: dict = field(init=False)
+    site_labels: list[tuple[str, str]] = field(init=False)
+    legend_template: Template = field(init=False, default=None)
 
     def __post_init__(self):
-        self.geocell_data = self._load_data(self.geocell_data)
-        self.driveless_data = self._load_data(self.driveless_data)
+        self.geocell_data = self._load_data(self.geocell_data, GEOCELL_COLUMNS)
+        self.driveless_data = self._load_data(self.driveless_data, DRIVELESS_COLUMNS)
+        self.data_key = self._hash_data()
         self.unique_cellname = self._get_unique_cellname()
         self.map_center = self._calculate_map_center()
         self.tile_options = self._define_tile_options()
         self.ci_colors = self._assign_ci_colors()
+        self.geocell_data = self._with_ci_colors(self.geocell_data)
+        self.driveless_data = self._with_ci_colors(self.driveless_data)
+        self.sector_geojson = self._build_sector_geojson()
+        self.site_geojson = self._build_site_geojson()
+        self.site_labels = self._build_site_labels()
 
     @staticmethod
-    def _load_data(data: str | pd.DataFrame) -> pd.DataFrame:
-        return pd.read_csv(data) if isinstance(data, str) else data
+    def _load_data(data: str | pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        df = pd.read_csv(data) if isinstance(data, str) else data
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        df = df[columns].astype(
+            {column: "category" for column in CATEGORY_COLUMNS if column in columns}
+        )
+        integers = df.select_dtypes("integer").columns
+        return df.assign(
+            **{
+                column: pd.to_numeric(df[column], downcast="integer")
+                for column in integers
+            }
+        )
+
+    def _hash_data(self) -> int:
+        return hash(
+            tuple(
+                int(pd.util.hash_pandas_object(df).sum())
+                for df in (self.geocell_data, self.driveless_data)
+            )
+        )
 
     def _get_unique_cellname(self) -> list[str]:
-        if "cellname" not in self.geocell_data.columns:
-            raise ValueError("Column 'cellname' does not exist in geocell_data.")
         return sorted(self.geocell_data["cellname"].unique())
 
     def _calculate_map_center(self) -> list[float]:
@@ -47,192 +344,267 @@ class GeoApp:
         ]
 
     @staticmethod
-    def _define_tile_options() -> dict[str, str]:
-        return {
-            "Openstreetmap": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
-            "Google Hybrid": "https://mt1.google.com/vt/lyrs=y&x={x}&y={y}&z={z}",
-        }
+    def _define_tile_options() -> Mapping[str, str]:
+        return TILE_OPTIONS
 
     def _assign_ci_colors(self) -> dict[str, str]:
-        return {
-            ci: self._hsv_to_hex(index / len(self.unique_cellname))
-            for index, ci in enumerate(self.unique_cellname)
-        }
-
-    @staticmethod
-    def _hsv_to_hex(hue: float) -> str:
-        rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return f"#{int(rgb[0] * 255):02x}{int(rgb[1] * 255):02x}{int(rgb[2] * 255):02x}"
+        count = len(self.unique_cellname)
+        palette = (
+            CI_PALETTE
+            if count <= CI_PALETTE_SIZE
+            else hue_colors(np.arange(count) / count)
+        )
+        return dict(zip(self.unique_cellname, palette))
 
     def get_ci_color(self, ci: str) -> str:
         return self.ci_colors.get(ci, "black")
 
     @staticmethod
-    def get_rsrp_color(rsrp: float) -> str:
-        ranges = [
-            (-80, "blue"),
-            (-95, "#14380A"),
-            (-100, "#93FC7C"),
-            (-110, "yellow"),
-            (-115, "red"),
+    def _create_sector_beams(
+        df: pd.DataFrame,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        sites = df[["Latitude", "Longitude"]].round(COORDINATE_DECIMALS).to_numpy()
+        points = sector_beam_points(
+            sites[:, 0],
+            sites[:, 1],
+            df["Dir"].to_numpy(dtype=float),
+            df["Ant_BW"].to_numpy(dtype=float),
+            df["Ant_Size"].to_numpy(dtype=float),
+        ).round(COORDINATE_DECIMALS)
+
+        site_points = sites[:, None, :]
+        polygons = np.concatenate([site_points, points[:, :-1], site_points], axis=1)
+        return polygons, points[:, -1]
+
+    def _build_sector_geojson(self) -> dict:
+        polygons, edge_points = self._create_sector_beams(self.geocell_data)
+        cellnames = self.geocell_data["cellname"].tolist()
+        self.cell_edge_coordinates.update(zip(cellnames, edge_points.tolist()))
+        colors = self.geocell_data["_color"].tolist()
+        features = [
+            {
+                "type": "Feature",
+                "id": index,
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+                "properties": {"color": color},
+            }
+            for index, (ring, color) in enumerate(
+                zip(polygons[..., ::-1].tolist(), colors)
+            )
         ]
-        return next((color for limit, color in ranges if rsrp >= limit), "red")
-
-    def _create_sector_beam(
-        self, lat: float, lon: float, azimuth: float, beamwidth: float, radius: float
-    ) -> tuple[list[list[float]], list[float]]:
-        lat_rad, lon_rad, azimuth_rad = radians(lat), radians(lon), radians(azimuth)
-        beamwidth_rad = radians(beamwidth)
-        angle_step = beamwidth_rad / 49
-        start_angle = azimuth_rad - beamwidth_rad / 2
-
-        points = [[lat, lon]] + [
-            self._calculate_point(
-                lat_rad, lon_rad, start_angle + i * angle_step, radius
+        return {"type": "FeatureCollection", "features": features}
+
+    def _add_geocell_layer(self, folium_map: folium.Map):
+        geocell_layer = folium.FeatureGroup(name="Geocell Sites")
+        folium_map.get_root().header.add_child(folium.Element(CELL_LABEL_CSS))
+        self._add_sector_beams(geocell_layer)
+        self._add_site_markers(geocell_layer)
+        for cellname, label in self.site_labels:
+            self._add_site_label(cellname, label, geocell_layer)
+        geocell_layer.add_to(folium_map)
+
+    def _build_site_geojson(self) -> dict:
+        # Sectors of one site share its location, so only the last one drawn
+        # (the marker that is visible and receives clicks) is emitted.
+        sites = self.geocell_data.drop_duplicates(
+            ["site", "Latitude", "Longitude"], keep="last"
+        )
+        rows = self._iterate_rows(sites, ["Latitude", "Longitude", "_color"])
+        popups = self._create_popup_contents(sites)
+        features = [
+            {
+                "type": "Feature",
+                "id": index,
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"color": color, "popup": popup_content},
+            }
+            for index, ((lat, lon, color), popup_content) in enumerate(
+                zip(rows, popups)
             )
-            for i in range(50)
         ]
-        points.append([lat, lon])
+        return {"type": "FeatureCollection", "features": features}
 
-        edge_point = self._calculate_point(lat_rad, lon_rad, azimuth_rad, radius)
-        return points, edge_point
+    def _build_site_labels(self) -> list[tuple[str, str]]:
+        return list(
+            zip(
+                self.geocell_data["cellname"].tolist(),
+                self._create_label_contents(self.geocell_data),
+            )
+        )
 
     @staticmethod
-    def _calculate_point(
-        lat_rad: float, lon_rad: float, angle: float, radius: float
-    ) -> list[float]:
-        lat_new = asin(
-            sin(lat_rad) * cos(radius / 6371)
-            + cos(lat_rad) * sin(radius / 6371) * cos(angle)
-        )
-        lon_new = lon_rad + atan2(
-            sin(angle) * sin(radius / 6371) * cos(lat_rad),
-            cos(radius / 6371) - sin(lat_rad) * sin(lat_new),
-        )
-        return [degrees(lat_new), degrees(lon_new)]
+    def _iterate_rows(df: pd.DataFrame, columns: list[str]) -> Iterator[tuple]:
+        decimals = dict.fromkeys(COORDINATE_COLUMNS, COORDINATE_DECIMALS)
+        return df[columns].round(decimals).itertuples(index=False, name=None)
 
-    def _add_geocell_layer(self):
-        geocell_layer = folium.FeatureGroup(name="Geocell Sites")
-        for row in self._iterate_rows(self.geocell_data):
-            color = self.get_ci_color(row["cellname"])
-            self._add_sector_beam(row, color, geocell_layer)
-            self._add_site_label(row, geocell_layer)
-            self._add_circle_marker(row, color, geocell_layer)
-        geocell_layer.add_to(self.map)
-
-    def _iterate_rows(self, df: pd.DataFrame) -> Generator[pd.Series, None, None]:
-        yield from (row for _, row in df.iterrows())
-
-    def _add_sector_beam(self, row: pd.Series, color: str, layer: folium.FeatureGroup):
-        sector_polygon, edge_point = self._create_sector_beam(
-            row["Latitude"],
-            row["Longitude"],
-            row["Dir"],
-            row["Ant_BW"],
-            row["Ant_Size"],
-        )
-        folium.Polygon(
-            locations=sector_polygon,
-            color="black",
-            fill=True,
-            fill_color=color,
-            fill_opacity=1,
-        ).add_to(layer)
-        self._add_edge_marker(
-            edge_point[0], edge_point[1], row["Ant_Size"], color, layer
-        )
-        self.cell_edge_coordinates[row["cellname"]] = edge_point
-
-    def _add_edge_marker(
-        self,
-        lat: float,
-        lon: float,
-        radius: float,
-        color: str,
-        layer: folium.FeatureGroup,
-    ):
-        folium.Circle(
-            location=[lat, lon],
-            radius=0.001,
-            color="rgba(0, 0, 0, 0)",
-            fill=True,
-            fill_color="rgba(0, 0, 0, 0)",
-            fill_opacity=0.2,
+    def _with_ci_colors(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.assign(_color=self._ci_colors_for(df))
+
+    def _ci_colors_for(self, df: pd.DataFrame) -> list[str]:
+        # Unknown cellnames get code -1, which picks the trailing black entry.
+        codes = pd.Categorical(df["cellname"], categories=self.unique_cellname).codes
+        palette = np.array([*self.ci_colors.values(), "black"])
+        return palette[codes].tolist()
+
+    @staticmethod
+    def _rsrp_colors_for(df: pd.DataFrame) -> list[str]:
+        rsrp = df["rsrp"].to_numpy(dtype=float)
+        # searchsorted puts NaN past the last limit; a missing reading is red.
+        buckets = np.searchsorted(RSRP_LIMITS, rsrp, side="right")
+        return RSRP_COLORS[np.where(np.isnan(rsrp), 0, buckets)].tolist()
+
+    def _add_sector_beams(self, layer: folium.FeatureGroup):
+        folium.GeoJson(
+            self.sector_geojson,
+            style_function=lambda feature: {
+                "color": "black",
+                "fillColor": feature["properties"]["color"],
+                "fillOpacity": 1,
+            },
+            control=False,
         ).add_to(layer)
 
-    def _add_circle_marker(
-        self, row: pd.Series, color: str, layer: folium.FeatureGroup
-    ):
-        popup_content = self._create_popup_content(row)
-        folium.CircleMarker(
-            location=[row["Latitude"], row["Longitude"]],
-            radius=6,
-            popup=folium.Popup(popup_content, max_width=250),
-            color=color,
-            fill=True,
-            fill_color=color,
-            fill_opacity=1.0,
+    def _add_site_markers(self, layer: folium.FeatureGroup):
+        folium.GeoJson(
+            self.site_geojson,
+            marker=folium.CircleMarker(radius=6, fill=True, fill_opacity=1),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"],
+            },
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False, max_width=250),
+            control=False,
         ).add_to(layer)
 
-    def _add_site_label(self, row: pd.Series, layer: folium.FeatureGroup):
-        x, y = self.cell_edge_coordinates[row["cellname"]]
+    def _add_site_label(self, cellname: str, label: str, layer: folium.FeatureGroup):
+        x, y = self.cell_edge_coordinates[cellname]
         folium.Marker(
             location=[x, y],
-            popup=row["cellname"],
-            icon=folium.DivIcon(
-                html=f"""
-                    <div style="
-                        font-size: 16pt;
-                        color: black;
-                        text-shadow: -1px -1px 0 white, 1px -1px 0 white, -1px 1px 0 white, 1px 1px 0 white;">
-                        {row["cellname"]}
-                    </div>
-                """
-            ),
+            popup=cellname,
+            icon=folium.DivIcon(html=label),
         ).add_to(layer)
 
-    def _add_driveless_layer(self, color_by_ci: bool = True):
-        driveless_layer = folium.FeatureGroup(name="Driveless Data")
-        for row in self._iterate_rows(self.driveless_data):
-            color = (
-                self.get_ci_color(row["cellname"])
-                if color_by_ci
-                else self.get_rsrp_color(row["rsrp"])
+    def _add_driveless_layer(
+        self, folium_map: folium.Map, *, color_by_ci: bool = True, show: bool = True
+    ) -> folium.FeatureGroup:
+        driveless_layer = folium.FeatureGroup(
+            name=DRIVELESS_LAYER_NAMES[color_by_ci], show=show
+        )
+        colors = (
+            self.driveless_data["_color"].tolist()
+            if color_by_ci
+            else self._rsrp_colors_for(self.driveless_data)
+        )
+        if len(self.driveless_data) >= DRIVELESS_CLUSTER_THRESHOLD:
+            self._add_driveless_cluster(colors, driveless_layer)
+            driveless_layer.add_to(folium_map)
+        else:
+            rows = self._iterate_rows(self.driveless_data, DRIVELESS_COLUMNS)
+            points = self._add_driveless_geojson(rows, colors, driveless_layer)
+            driveless_layer.add_to(folium_map)
+            ZoomGate(points, driveless_layer, DRIVELESS_MIN_ZOOM).add_to(folium_map)
+        return driveless_layer
+
+    @staticmethod
+    def _add_driveless_geojson(
+        rows: Iterator[tuple], colors: list[str], layer: folium.FeatureGroup
+    ) -> folium.GeoJson:
+        features = [
+            {
+                "type": "Feature",
+                "id": index,
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"cellname": cellname, "rsrp": rsrp, "color": color},
+            }
+            for index, ((cellname, lat, lon, rsrp), color) in enumerate(
+                zip(rows, colors)
+            )
+        ]
+        return folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            marker=folium.CircleMarker(radius=6, fill=True, fill_opacity=1),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"],
+            },
+            popup=folium.GeoJsonPopup(
+                fields=["cellname", "rsrp"], aliases=["Cellname", "RSRP (dBm)"]
+            )
+            if features
+            else None,
+            control=False,
+        ).add_to(layer)
+
+    def _add_driveless_cluster(self, colors: list[str], layer: folium.FeatureGroup):
+        df = self.driveless_data
+        popups = (
+            "Cellname: "
+            + df["cellname"].astype(str)
+            + "<br>RSRP: "
+            + df["rsrp"].astype(str)
+            + " dBm"
+        )
+        rows = self._iterate_rows(df, ["lat_grid", "long_grid"])
+        data = [
+            [lat, lon, color, popup]
+            for (lat, lon), color, popup in zip(rows, colors, popups)
+        ]
+        FastMarkerCluster(
+            data, callback=DRIVELESS_CLUSTER_CALLBACK, control=False
+        ).add_to(layer)
+
+    def _add_spider_graph(self, folium_map: folium.Map, *, show: bool = True):
+        spider_layer = folium.FeatureGroup(name="Spider Graph", show=show)
+        # Only rows whose cell has a drawn sector get a spider line; the inner
+        # merge drops the rest and brings the edge point along as columns.
+        edges = pd.DataFrame.from_dict(
+            self.cell_edge_coordinates,
+            orient="index",
+            columns=["edge_lat", "edge_lon"],
+        )
+        linked = self.driveless_data.merge(edges, left_on="cellname", right_index=True)
+        rows = self._iterate_rows(
+            linked, ["lat_grid", "long_grid", "edge_lat", "edge_lon"]
+        )
+        colors = linked["_color"].tolist()
+        features = []
+        for index, ((lat, lon, edge_lat, edge_lon), color) in enumerate(
+            zip(rows, colors)
+        ):
+            distance = geodesic(self.map_center, (lat, lon)).kilometers
+            features.append(
+                {
+                    "type": "Feature",
+                    "id": index,
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[lon, lat], [edge_lon, edge_lat]],
+                    },
+                    "properties": {"distance": f"{distance:.2f}", "color": color},
+                }
             )
-            folium.CircleMarker(
-                location=[row["lat_grid"], row["long_grid"]],
-                radius=6,
-                popup=f"Cellname: {row['cellname']}<br>RSRP: {row['rsrp']} dBm",
-                color=color,
-                fill=True,
-                fill_color=color,
-                fill_opacity=1,
-            ).add_to(driveless_layer)
-        driveless_layer.add_to(self.map)
-
-    def _add_spider_graph(self):
-        for row in self._iterate_rows(self.driveless_data):
-            point_location = (row["lat_grid"], row["long_grid"])
-            distance = geodesic(self.map_center, point_location).kilometers
-            if row["cellname"] in self.cell_edge_coordinates:
-                edge_lat, edge_lon = self.cell_edge_coordinates[row["cellname"]]
-                color = self.get_ci_color(row["cellname"])
-                folium.PolyLine(
-                    locations=[
-                        [row["lat_grid"], row["long_grid"]],
-                        [edge_lat, edge_lon],
-                    ],
-                    color=color,
-                    weight=0.5,
-                    opacity=0.5,
-                    popup=f"Distance from Site:<br>{distance:.2f} km",
-                ).add_to(self.map)
-
-    def _initialize_map(self, tile_provider: str):
-        self.map = folium.Map(
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "weight": 0.5,
+                "opacity": 0.5,
+            },
+            popup=folium.GeoJsonPopup(
+                fields=["distance"], aliases=["Distance from Site (km)"]
+            )
+            if features
+            else None,
+            control=False,
+        ).add_to(spider_layer)
+        spider_layer.add_to(folium_map)
+
+    def _initialize_map(self, tile_provider: str) -> folium.Map:
+        folium_map = folium.Map(
             location=self.map_center,
             tiles=self.tile_options[tile_provider],
             attr=tile_provider,
+            prefer_canvas=True,
         )
 
         if self.driveless_data is not None:
@@ -246,30 +618,38 @@ class GeoApp:
                     self.driveless_data["long_grid"].max(),
                 ],
             ]
-            self.map.fit_bounds(bounds, padding=(5, 5))
+            folium_map.fit_bounds(bounds, padding=(5, 5))
+        return folium_map
 
-    def _add_dynamic_legend(self, color_by_ci: bool):
-        legend_template = self._create_legend_template(color_by_ci)
-        legend_macro = MacroElement()
-        legend_macro._template = Template(legend_template)
-        self.map.get_root().add_child(legend_macro)
+    def _add_dynamic_legend(
+        self, folium_map: folium.Map, layers: Mapping[bool, folium.FeatureGroup]
+    ):
+        legend = folium.Element()
+        legend._template = self._create_legend_template()
+        folium_map.get_root().html.add_child(legend)
+        ExclusiveLayers(
+            {
+                LEGEND_SECTION_IDS[color_by_ci]: layer
+                for color_by_ci, layer in layers.items()
+            }
+        ).add_to(folium_map)
 
     def calculate_rsrp_statistics(self) -> list[str]:
-        rsrp_ranges = [
-            ("-80  >= 0", lambda rsrp: rsrp >= -80, "blue"),
-            ("-95  >= -80", lambda rsrp: -95 <= rsrp < -80, "#14380A"),
-            ("-100 >= -95", lambda rsrp: -100 <= rsrp < -95, "#93FC7C"),
-            ("-110 >= -100", lambda rsrp: -110 <= rsrp < -100, "yellow"),
-            ("-110 >= -140", lambda rsrp: rsrp < -110, "red"),
-        ]
+        bins = pd.cut(
+            self.driveless_data["rsrp"],
+            bins=RSRP_LEGEND_BINS,
+            labels=RSRP_LEGEND_LABELS,
+            right=False,
+        )
+        counts = bins.value_counts(sort=False)
 
         total_records = len(self.driveless_data)
         results = []
 
-        for label, condition, color in rsrp_ranges:
-            count = self.driveless_data[
-                self.driveless_data["rsrp"].apply(condition)
-            ].shape[0]
+        for label, color in zip(
+            reversed(RSRP_LEGEND_LABELS), reversed(RSRP_LEGEND_COLORS)
+        ):
+            count = counts[label]
             percentage = (count / total_records) * 100 if total_records > 0 else 0
             results.append(
                 f"<li><span style='background:  {color}; opacity: 1;'></span>{label}&emsp;{count}&emsp;{percentage:.2f}%</li>"
@@ -278,74 +658,97 @@ class GeoApp:
         return results
 
     def calculate_cellname_statistics(self) -> list[str]:
-        total_records = len(self.driveless_data)
-        results = []
-
         counts = self.driveless_data["cellname"].value_counts()
-
-        for cellname, count in counts.items():
-            percentage = (count / total_records) * 100 if total_records > 0 else 0
-            color = self.get_ci_color(cellname)
-            results.append(
-                f"<li><span style='background: {color}; opacity: 1;'></span>{cellname}&emsp;{count}&emsp;{percentage:.2f}%</li>"
+        # Categorical columns also report unused categories; skip those.
+        counts = counts[counts > 0]
+        stats = pd.DataFrame(
+            {"cellname": counts.index.astype(str), "count": counts.to_numpy()}
+        )
+        percentages = np.char.mod(
+            "%.2f", stats["count"].to_numpy() / len(self.driveless_data) * 100
+        )
+        items = (
+            "<li><span style='background: "
+            + pd.Series(self._ci_colors_for(stats), dtype=str)
+            + "; opacity: 1;'></span>"
+            + stats["cellname"]
+            + "&emsp;"
+            + stats["count"].astype(str)
+            + "&emsp;"
+            + percentages
+            + "%</li>"
+        )
+        return items.tolist()
+
+    def _create_legend_template(self) -> Template:
+        if self.legend_template is None:
+            self.legend_template = Template(
+                "".join(
+                    [
+                        LEGEND_HEADER,
+                        self._legend_section(color_by_ci=False),
+                        self._legend_section(color_by_ci=True),
+                        LEGEND_FOOTER,
+                    ]
+                )
             )
+        return self.legend_template
 
-        return results
-
-    def _create_legend_template(self, color_by_ci: bool) -> str:
+    def _legend_section(self, *, color_by_ci: bool) -> str:
         sitename = self.geocell_data["site"].iloc[0]
-        legend_template = """
-        {% macro html(this, kwargs) %}
-        <div id='maplegend' class='maplegend'
-            style='position: absolute; z-index:9999; background-color: rgba(192, 192, 192, 1);
-            border-radius: 6px; padding: 10px; font-size: 12px; right: 12px; top: 70px;'>
-        <div class='legend-scale'>
-        <ul class='legend-labels'>
-        """
         if color_by_ci:
-            legend_template += f"<li><strong>{sitename}<br>by EUtranCell</strong></li>"
-            legend_template += "".join(self.calculate_cellname_statistics())
+            title, statistics = "by EUtranCell", self.calculate_cellname_statistics()
         else:
-            legend_template += f"<li><strong>{sitename}<br>by RSRP</strong></li>"
-            legend_template += "".join(self.calculate_rsrp_statistics())
+            title, statistics = "by RSRP", self.calculate_rsrp_statistics()
+        return "".join(
+            [
+                f"<ul class='legend-labels' id='{LEGEND_SECTION_IDS[color_by_ci]}'>",
+                f"<li><strong>{sitename}<br>{title}</strong></li>",
+                *statistics,
+                "</ul>",
+            ]
+        )
 
-        legend_template += """
-        </ul>
-        </div>
-        </div>
-        <style type='text/css'>
-        .maplegend .legend-scale ul {margin: 0; padding: 0; color: #0f0f0f;}
-        .maplegend .legend-scale ul li {list-style: none; line-height: 18px; margin-bottom: 1.5px;}
-        .maplegend ul.legend-labels li span {
-            float: left;
-            height: 14px;
-            width: 14px;
-            margin-right: 4.5px;
-            border-radius: 50%;
+    def _build_map_html(self, tile_provider: str) -> str:
+        # The app is shared across sessions, so the map stays local to the
+        # render instead of living on the instance.
+        folium_map = self._initialize_map(tile_provider)
+        self._add_geocell_layer(folium_map)
+
+        driveless_layers = {
+            color_by_ci: self._add_driveless_layer(
+                folium_map, color_by_ci=color_by_ci, show=not color_by_ci
+            )
+            for color_by_ci in (False, True)
         }
-        </style>
-        {% endmacro %}
-        """
-        return legend_template
+        self._add_spider_graph(folium_map)
 
-    def _display_map(self, color_by_ci: bool):
-        folium.LayerControl().add_to(self.map)
-        self._add_dynamic_legend(color_by_ci)
-        st.components.v1.html(self.map._repr_html_(), height=600)
+        folium.LayerControl().add_to(folium_map)
+        self._add_dynamic_legend(folium_map, driveless_layers)
+        return folium_map.get_root().render()
 
     @staticmethod
-    def _create_popup_content(row: pd.Series) -> str:
-        return f"""
-        <div style="font-family: Arial; font-size: 16px;">
-            <b>Site:</b> {row['site']}<br>
-            <b>Node:</b> {row['nodeid']}<br>
-            <b>Cell:</b> {row['cellname']}
-        </div>
-        """
+    def _create_popup_contents(df: pd.DataFrame) -> list[str]:
+        popups = (
+            '<div style="font-family: Arial; font-size: 16px;"><b>Site:</b> '
+            + df["site"].astype(str)
+            + "<br><b>Node:</b> "
+            + df["nodeid"].astype(str)
+            + "<br><b>Cell:</b> "
+            + df["cellname"].astype(str)
+            + "</div>"
+        )
+        return popups.tolist()
+
+    @staticmethod
+    def _create_label_contents(df: pd.DataFrame) -> list[str]:
+        labels = '<div class="cell-label">' + df["cellname"].astype(str) + "</div>"
+        return labels.tolist()
 
     def run_geo_app(self):
+        tile_providers = list(self.tile_options)
         if "tile_provider" not in st.session_state:
-            st.session_state.tile_provider = list(self.tile_options.keys())[1]
+            st.session_state.tile_provider = tile_providers[1]
 
         st.markdown(
             *styling("📝 Note:", tag="h6", text_align="left", font_size=26, color="red")
@@ -363,39 +766,21 @@ class GeoApp:
             )
         )
 
-        col1, col2, _, _ = st.columns([1, 1, 2, 2])
+        col1, _ = st.columns([1, 5])
         with col1:
             tile_provider = st.selectbox(
                 "MAP",
-                list(self.tile_options.keys()),
-                index=list(self.tile_options.keys()).index(
-                    st.session_state.tile_provider
-                ),
+                tile_providers,
+                index=tile_providers.index(st.session_state.tile_provider),
                 key="tile_provider_select",
             )
 
-        if st.session_state.tile_provider != tile_provider:
-            st.session_state.tile_provider = tile_provider
-            st.rerun()
-
-        categories = [
-            "RSRP with Spidergraph",
-            "RSRP",
-            "cellname",
-            "cellname with Spidergraph",
-        ]
-
-        with col2:
-            selected_category = st.selectbox("Category", categories)
-
-        st.subheader(selected_category)
-        self._initialize_map(tile_provider)
-        self._add_geocell_layer()
+        st.session_state.tile_provider = tile_provider
 
-        color_by_ci = "cellname" in selected_category
-        self._add_driveless_layer(color_by_ci=color_by_ci)
+        map_html = _render_map_html(self, self.data_key, tile_provider)
+        st.components.v1.html(map_html, height=600)
 
-        if "Spidergraph" in selected_category:
-            self._add_spider_graph()
 
-        self._display_map(color_by_ci)
+@st.cache_data(max_entries=8)
+def _render_map_html(_app: GeoApp, data_key: int, tile_provider: str) -> str:
+    return _app._build_map_html(tile_provider)
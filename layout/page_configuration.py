@@ -1,15 +1,6 @@
 import streamlit as st
 
-
-def page_config():
-    st.set_page_config(
-        page_title="Geocell Visualization",
-        layout="wide",
-        page_icon="☢️",
-    )
-    st.markdown(
-        """
-        <style>
+PAGE_STYLE = """
         [data-testid="collapsedControl"] {
             display: none;
         }
@@ -20,12 +11,39 @@ def page_config():
             padding-right: 1rem;
             padding-bottom: 1rem;
         }
-        </style>
-    """,
-        unsafe_allow_html=True,
+"""
+PAGE_WIDTH_STYLE = """
+    .main .block-container {{
+        max-width: {width}px;
+        padding-left: 1rem;
+        padding-right: 1rem;
+    }}
+"""
+
+
+def page_config():
+    st.set_page_config(
+        page_title="Geocell Visualization",
+        layout="wide",
+        page_icon="☢️",
     )
 
 
+def page_style(width: int | None = None):
+    """Inject the app's page CSS in a single markdown block.
+
+    Args:
+    ----
+        width (int | None): Optional maximum width in pixels for the content area.
+    """
+    st.markdown(_page_css(width), unsafe_allow_html=True)
+
+
+def _page_css(width: int | None) -> str:
+    width_style = PAGE_WIDTH_STYLE.format(width=width) if width is not None else ""
+    return f"<style>{PAGE_STYLE}{width_style}</style>"
+
+
 def set_page_width(width: int):
     """Set the page width for a Streamlit app with custom CSS.
 
@@ -33,13 +51,5 @@ def set_page_width(width: int):
     ----
         width (int): The maximum width in pixels for the content area.
     """
-    style = f"""
-    <style>
-    .main .block-container {{
-        max-width: {width}px;
-        padding-left: 1rem;
-        padding-right: 1rem;
-    }}
-    </style>
-    """
-    st.markdown(style, unsafe_allow_html=True)
+    style = PAGE_WIDTH_STYLE.format(width=width)
+    st.markdown(f"<style>{style}</style>", unsafe_allow_html=True)
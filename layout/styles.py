@@ -24,9 +24,8 @@ def multi_color_styling(
     background_color: str = "transparent",
 ) -> str:
     style = f"text-align: {text_align}; font-size: {font_size}px; font-family: {font_family}; background-color: {background_color};"
-    styled_text = f'<{tag} style="{style}">'
-    for text, color in text_color_pairs:
-        styled_text += f'<span style="color: {color};">{text}</span><br>'
-    styled_text = styled_text.rstrip("<br>")
-    styled_text += f"</{tag}>"
-    return styled_text
+    spans = "<br>".join(
+        f'<span style="color: {color};">{text}</span>'
+        for text, color in text_color_pairs
+    )
+    return f'<{tag} style="{style}">{spans}</{tag}>'